@@ -1,4 +1,5 @@
 
+import contextlib
 import enum
 import functools
 import hashlib
@@ -10,6 +11,7 @@ import logging
 import math
 import os
 import sys
+import time
 import traceback
 import typing
 from dataclasses import dataclass
@@ -101,6 +103,11 @@ def initialize_easy_nodes(default_category: str = "EasyNodes",
         assert _current_config.auto_register or not _current_config.NODE_CLASS_MAPPINGS, (
             f"Auto-registration was turned off by previous initializer, but {len(_current_config.NODE_CLASS_MAPPINGS)} nodes were not picked up.")
 
+    # Other node packages load one after another, never while ours is registering its nodes, so what's
+    # in ComfyUI's maps now is all the duplicate checks need from them.
+    _registered_display_names.update(comfyui_nodes.NODE_DISPLAY_NAME_MAPPINGS.values())
+    _registered_node_classes.update(comfyui_nodes.NODE_CLASS_MAPPINGS.values())
+
     NODE_CLASS_MAPPINGS = {}
     NODE_DISPLAY_NAME_MAPPINGS = {}
     
@@ -197,15 +204,17 @@ class NumberInput(float):
         return instance
 
     def to_dict(self):
-        metadata = {
-            "default": self,
-            "display": self.display,
-            "min": self.min,
-            "max": self.max,
-            "step": self.step,
-            "round": self.round,
-        }
-        metadata = {k: v for k, v in metadata.items() if v is not None}
+        metadata = {"default": self}
+        if self.display is not None:
+            metadata["display"] = self.display
+        if self.min is not None:
+            metadata["min"] = self.min
+        if self.max is not None:
+            metadata["max"] = self.max
+        if self.step is not None:
+            metadata["step"] = self.step
+        if self.round is not None:
+            metadata["round"] = self.round
         return metadata
 
     def __repr__(self):
@@ -221,6 +230,11 @@ _after_first_prompt = False
 _module_reload_times = {}
 _module_dict = {}
 
+# Module name -> (time.monotonic() of last mtime poll, mtime seen then). Editing a file
+# takes much longer than a workflow step, so there's no need to stat it on every call.
+_module_check_times = {}
+_MODULE_CHECK_INTERVAL = 0.5
+
 _function_dict = {}
 _function_checksums = {}
 _function_update_times = {}
@@ -228,6 +242,11 @@ _function_update_times = {}
 _curr_preview = {}
 _curr_unique_id = None
 
+# Display names and node classes that new nodes may not reuse, for O(1) duplicate checks: everything registered
+# through _create_comfy_node across all configs, plus a snapshot of ComfyUI's maps taken at each initialization.
+_registered_display_names = set()
+_registered_node_classes = set()
+
 
 class CustomVerifier:
     def __init__(self):
@@ -266,6 +285,14 @@ class AnythingVerifier(CustomVerifier):
         pass
 
 
+# The full range of values representable by some dtypes, for skipping range checks they can't fail.
+_DTYPE_VALUE_RANGES = {
+    torch.bool: (0, 1),
+    torch.uint8: (0, 255),
+    torch.int8: (-128, 127),
+}
+
+
 @dataclass
 class TensorVerifier(CustomVerifier):
     tensor_type_name: str
@@ -278,7 +305,15 @@ class TensorVerifier(CustomVerifier):
         assert isinstance(tensor, torch.Tensor), f"Expected an {self.tensor_type_name}, got {type(tensor).__name__}"
         
         if self.allowed_range is not None:
-            assert tensor.min() >= self.allowed_range[0] and tensor.max() <= self.allowed_range[1], f"{self.tensor_type_name} tensor must have values between {self.allowed_range[0]} and {self.allowed_range[1]}, got min {tensor.min()} and max {tensor.max()}"
+            low, high = self.allowed_range
+            dtype_range = _DTYPE_VALUE_RANGES.get(tensor.dtype)
+            # Skip the scan entirely if the dtype can't hold anything out of range. Empty tensors
+            # still go through aminmax, which rejects them like min() always has.
+            if dtype_range is None or dtype_range[0] < low or dtype_range[1] > high or tensor.numel() == 0:
+                # One pass for both bounds, and one device sync for the comparison.
+                tensor_min, tensor_max = tensor.aminmax()
+                if not ((tensor_min >= low) & (tensor_max <= high)):
+                    raise AssertionError(f"{self.tensor_type_name} tensor must have values between {low} and {high}, got min {tensor_min.item()} and max {tensor_max.item()}")
         
         if self.allowed_shapes is not None:
             assert len(tensor.shape) in self.allowed_shapes, f"{self.tensor_type_name} tensor must have shape in {self.allowed_shapes}, got {tensor.shape}"
@@ -295,6 +330,7 @@ class TensorVerifier(CustomVerifier):
 _custom_verifiers: Dict[str, CustomVerifier] = {}
 
 
+@functools.lru_cache(maxsize=None)
 def _get_fully_qualified_name(cls: type) -> str:
     return f"{cls.__module__}.{cls.__qualname__}"
 
@@ -345,6 +381,9 @@ def register_type(
     _ANNOTATION_TO_COMFYUI_TYPE[key] = name
     _SHOULD_AUTOCONVERT[key] = should_autoconvert
     _DEFAULT_FORCE_INPUT[key] = force_input
+    # A new key can change how already-seen annotations resolve (e.g. registering list makes
+    # list[int] resolve to list rather than int).
+    _ANNOTATION_TYPE_STR_CACHE.clear()
 
 
 # Made to match any and all other types.
@@ -355,7 +394,20 @@ class AnyType(str):
 any_type = AnyType("*")
 
 
+# Annotation object (plain or parametrized, e.g. list[ImageTensor]) -> ComfyUI type string.
+# Cleared by register_type whenever it adds a type; unregistered types raise before anything is stored.
+_ANNOTATION_TYPE_STR_CACHE = {}
+
+
 def _get_type_str(the_type: type) -> str:
+    type_str = _ANNOTATION_TYPE_STR_CACHE.get(the_type)
+    if type_str is None:
+        type_str = _resolve_type_str(the_type)
+        _ANNOTATION_TYPE_STR_CACHE[the_type] = type_str
+    return type_str
+
+
+def _resolve_type_str(the_type: type) -> str:
     key = _get_fully_qualified_name(the_type)
     if key not in _ANNOTATION_TO_COMFYUI_TYPE and get_origin(the_type) is list:
         return _get_type_str(get_args(the_type)[0])
@@ -370,10 +422,15 @@ def _get_type_str(the_type: type) -> str:
     return type_str
 
 
-_gpu_device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
 _cpu_device = torch.device("cpu")
 
 
+@functools.lru_cache(maxsize=None)
+def _get_gpu_device() -> torch.device:
+    """Resolved on first use, so nodes that never auto-move tensors don't probe CUDA. Call cache_clear() to re-probe."""
+    return torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+
+
 def show_image(image: torch.Tensor, type: str = None):
     if type is None:
         retain_previews = config_service.get_config_value("easy_nodes.RetainPreviews", False)
@@ -384,16 +441,23 @@ def show_image(image: torch.Tensor, type: str = None):
         if len(image.shape) == 2:
             image = image.unsqueeze(-1)
 
+        # Convert to uint8 on the tensor's own device so a quarter of the bytes cross over to
+        # the host, and the float intermediates never get materialized as numpy arrays.
+        if not image.is_floating_point():
+            # clamp has no bool kernel, and integer images need scaling the same way floats do.
+            image = image.float()
+        image = image.clamp(0, 1).mul_(255).to(torch.uint8)
+
         if image.shape[-1] == 1:
             image = torch.cat([image] * 3, axis=-1)
 
-        image = image.cpu().numpy()
-
-        image = Image.fromarray(np.clip(image * 255.0, 0, 255).astype(np.uint8))
+        image = image.contiguous().cpu().numpy()
 
         import folder_paths
         
-        unique = hashlib.md5(image.tobytes()).hexdigest()[:8]
+        # Hash the pixel buffer directly rather than copying it out of the PIL image.
+        unique = hashlib.md5(image).hexdigest()[:8]
+        image = Image.fromarray(image)
 
         filename = f"preview-{_curr_unique_id}_{unique}.png"
         
@@ -402,7 +466,8 @@ def show_image(image: torch.Tensor, type: str = None):
         full_output_path = Path(folder_paths.get_directory_by_type(type)) / subfolder / filename
 
         full_output_path.parent.mkdir(parents=True, exist_ok=True)
-        image.save(str(full_output_path), compress_level=4)
+        # Previews are throwaway, so favor encode speed over file size.
+        image.save(str(full_output_path), compress_level=1)
 
         if "images" not in _curr_preview:
             _curr_preview["images"] = []
@@ -420,6 +485,18 @@ def show_text(text: str):
     _curr_preview["text"].append(text)
 
 
+def _verify_nested(verifier: callable, val: any):
+    """Runs verifier on val, or on every leaf of val if it's a (possibly nested) list."""
+    pending = [val]
+    while pending:
+        val = pending.pop()
+        if isinstance(val, list):
+            # Reversed so leaves still get verified in their original order.
+            pending.extend(reversed(val))
+        else:
+            verifier(val)
+
+
 def _verify_values(config: EasyNodesConfig,
                    list_type: str, 
                    values: list[any], 
@@ -439,12 +516,6 @@ def _verify_values(config: EasyNodesConfig,
 
         if debug:
             logging.info(f"Result {i} is {type(val)}, expected {types[i]}")
-        def recursive_verify(verifier: callable, val: any):
-            if isinstance(val, list):
-                for v in val:
-                    recursive_verify(verifier, v)
-            else:
-                verifier(val)
 
         # def verify(verifier: callable, val: any, return_name: str, severity: CheckSeverityMode):
     
@@ -454,7 +525,7 @@ def _verify_values(config: EasyNodesConfig,
         if param_type in _custom_verifiers:
             if config.verify_level in [CheckSeverityMode.WARN, CheckSeverityMode.FATAL]:
                 try:
-                    recursive_verify(_custom_verifiers[param_type], val)
+                    _verify_nested(_custom_verifiers[param_type], val)
                 except Exception as e:
                     logging.error(_custom_verifiers)
                     logging.error(val)
@@ -467,10 +538,27 @@ def _verify_values(config: EasyNodesConfig,
 
 
 def _move_all_tensors_to_device(device: torch.device, tensor_or_tensors: Union[any, list]):
+    # Issue every copy out of CUDA without blocking, then wait once at the end on each device
+    # that was copied from to the host (copies onto a CUDA device are already ordered on its stream).
+    host_copy_sources = set()
+    moved = _queue_tensor_moves(device, tensor_or_tensors, host_copy_sources)
+    for source_device in host_copy_sources:
+        torch.cuda.current_stream(source_device).synchronize()
+    return moved
+
+
+def _queue_tensor_moves(device: torch.device, tensor_or_tensors: Union[any, list], host_copy_sources: set):
     if isinstance(tensor_or_tensors, torch.Tensor):
-        return tensor_or_tensors.to(device)
+        if tensor_or_tensors.device == device:
+            return tensor_or_tensors
+        # Only CUDA copies can be synchronized here, so anything else (e.g. MPS) stays blocking.
+        if not tensor_or_tensors.is_cuda:
+            return tensor_or_tensors.to(device)
+        if device.type == "cpu":
+            host_copy_sources.add(tensor_or_tensors.device)
+        return tensor_or_tensors.to(device, non_blocking=True)
     elif isinstance(tensor_or_tensors, list):
-        return [_move_all_tensors_to_device(device, a) for a in tensor_or_tensors]
+        return [_queue_tensor_moves(device, a, host_copy_sources) for a in tensor_or_tensors]
     return tensor_or_tensors
 
 
@@ -485,14 +573,16 @@ def _image_info(image: Union[torch.Tensor, np.ndarray]) -> str:
         return f"shape={image.shape}, dtype={image.dtype}, min={image.min()}, max={image.max()} mean={image.mean()} sum={image.sum()} "
 
 
-class BufferHandler(logging.Handler):
-    def __init__(self, buffer):
-        logging.Handler.__init__(self)
-        self.buffer = buffer
-    
-    def emit(self, record):
-        msg = self.format(record)
-        self.buffer.write(msg + '\n')
+def _describe_inputs(inputs: dict) -> list[str]:
+    input_desc = []
+    for key, arg in inputs.items():
+        desc_name = _get_fully_qualified_name(type(arg))
+        if isinstance(arg, torch.Tensor):
+            # This is only built when debugging a failure, so the full statistics are worth it.
+            input_desc.append(f"{key} ({desc_name}): {_image_info(arg)}")
+        else:
+            input_desc.append(f"{key} ({desc_name}): {arg}")
+    return input_desc
 
 
 class Tee(object):
@@ -508,6 +598,32 @@ class Tee(object):
             f.flush()
 
 
+_capture_formatter = logging.Formatter('%(levelname)s: %(message)s')
+
+
+@contextlib.contextmanager
+def _capture_output(enabled: bool):
+    """Copies stdout and root logger output into a StringIO (yielded) for the duration, or yields None if not enabled."""
+    # Nodes always run with the root logger at INFO, captured or not. setLevel clears every
+    # logger's level cache, so skip it when the level is already right.
+    root_logger = logging.getLogger()
+    if root_logger.level != logging.INFO:
+        root_logger.setLevel(logging.INFO)
+
+    if not enabled:
+        yield None
+        return
+
+    with io.StringIO() as buffer, contextlib.redirect_stdout(Tee(sys.stdout, buffer)):
+        capture_handler = logging.StreamHandler(buffer)
+        capture_handler.setFormatter(_capture_formatter)
+        root_logger.addHandler(capture_handler)
+        try:
+            yield buffer
+        finally:
+            root_logger.removeHandler(capture_handler)
+
+
 def _compute_function_checksum(func_to_check):
     try:
         source_code = inspect.getsource(func_to_check)
@@ -527,15 +643,28 @@ def _register_function(func: callable, checksum, timestamp):
     _function_update_times[func.__qualname__] = timestamp
 
 
+def _get_module(module_name: str):
+    module = _module_dict.get(module_name)
+    if module is None:
+        # Usually already imported, in which case sys.modules has it.
+        module = sys.modules.get(module_name) or importlib.import_module(module_name)
+        _module_dict[module_name] = module
+    return module
+
+
 def _get_latest_version_of_module(module_name: str, debug: bool = False):
-    if module_name not in _module_dict:
-        _module_dict[module_name] = importlib.import_module(module_name)
-    module = _module_dict[module_name]
+    module = _get_module(module_name)
+
+    now = time.monotonic()
+    last_check_time, last_modified_time = _module_check_times.get(module_name, (None, None))
+    if last_check_time is not None and now - last_check_time < _MODULE_CHECK_INTERVAL:
+        return module, last_modified_time
     
     module_file = module.__file__
     
     # First reload the module if it needs to be reloaded.
     current_modified_time = os.path.getmtime(module_file)
+    _module_check_times[module_name] = (now, current_modified_time)
     module_reload_time = _module_reload_times.get(module_name, 0)
     if current_modified_time > module_reload_time:
         time_diff = current_modified_time - module_reload_time
@@ -576,83 +705,78 @@ def _get_latest_version_of_func(func: callable, debug: bool = False):
     return _function_dict[func.__qualname__]
 
 
+def _get_max_tries() -> int:
+    llm_debugging_enabled = config_service.get_config_value("easy_nodes.llm_debugging", "Off") != "Off"
+    return int(config_service.get_config_value("easy_nodes.max_tries", 1)) if llm_debugging_enabled == "AutoFix" else 1
+
+
 def _call_function_and_verify_result(config: EasyNodesConfig, func: callable, 
-                                     args, kwargs, debug, input_desc, adjusted_return_types, 
+                                     args, kwargs, debug, input_desc, max_tries, adjusted_return_types, 
                                      wrapped_name, return_names=None):
     try_count = 0
-    llm_debugging_enabled = config_service.get_config_value("easy_nodes.llm_debugging", "Off") != "Off"
-    max_tries = int(config_service.get_config_value("easy_nodes.max_tries", 1)) if llm_debugging_enabled == "AutoFix" else 1
     
-    logging.debug(f"Running {func.__qualname__} with {max_tries} tries. {llm_debugging_enabled}")
+    # The captured output is only consumed by the LLM debugger between tries.
+    capture_output = max_tries > 1
+    
+    logging.debug(f"Running {func.__qualname__} with {max_tries} tries.")
 
     while try_count < max_tries:
         try_count += 1
-        try:
-            return_line_number = func.__code__.co_firstlineno
-            node_logger = logging.getLogger()
-            node_logger.setLevel(logging.INFO)
-            buffer = io.StringIO()
-            buffer_handler = BufferHandler(buffer)
-            node_logger.addHandler(buffer_handler)
-            buffer_handler.setFormatter(logging.Formatter('%(levelname)s: %(message)s'))
-            sys.stdout = Tee(sys.stdout, buffer)
-
-            _curr_preview.clear()
-            result = func(*args, **kwargs)
-
-            code_origin_loc = f"\n Source: {func.__qualname__} {func.__code__.co_filename}:{return_line_number}"
-            num_expected_returns = len(adjusted_return_types)
-            if num_expected_returns == 0:
-                assert result is None, f"{wrapped_name}: Return value is not None, but no return type specified.\n{code_origin_loc}"
-                return (None,)
-
-            if not isinstance(result, tuple):
-                result = (result,)
-            assert len(result) == len(
-                adjusted_return_types
-            ), f"{wrapped_name}: Number of return values {len(result)} does not match number of return types {len(adjusted_return_types)}\n{code_origin_loc}"
-
-            for i, ret in enumerate(result):
-                if ret is None:
-                    logging.warning(f"Result {i} is None")
-
-            new_result = _move_all_tensors_to_device(_cpu_device, list(result)) if config.auto_move_tensors else list(result)
-            _verify_values(config, "OUTPUT", result, adjusted_return_types, return_names, code_origin_loc, debug=debug)
-
-            for i, ret in enumerate(new_result):
-                new_result[i] = maybe_autoconvert(adjusted_return_types[i], ret)
+        with _capture_output(capture_output) as buffer:
+            try:
+                return_line_number = func.__code__.co_firstlineno
+
+                _curr_preview.clear()
+                result = func(*args, **kwargs)
+
+                code_origin_loc = f"\n Source: {func.__qualname__} {func.__code__.co_filename}:{return_line_number}"
+                num_expected_returns = len(adjusted_return_types)
+                if num_expected_returns == 0:
+                    assert result is None, f"{wrapped_name}: Return value is not None, but no return type specified.\n{code_origin_loc}"
+                    return (None,)
+
+                if not isinstance(result, tuple):
+                    result = (result,)
+                assert len(result) == len(
+                    adjusted_return_types
+                ), f"{wrapped_name}: Number of return values {len(result)} does not match number of return types {len(adjusted_return_types)}\n{code_origin_loc}"
+
+                for i, ret in enumerate(result):
+                    if ret is None:
+                        logging.warning(f"Result {i} is None")
+
+                # Move everything in one batch, then verify the host copies so the checks don't
+                # trigger their own device syncs.
+                new_result = _move_all_tensors_to_device(_cpu_device, list(result)) if config.auto_move_tensors else list(result)
+                _verify_values(config, "OUTPUT", new_result, adjusted_return_types, return_names, code_origin_loc, debug=debug)
+
+                for i, ret in enumerate(new_result):
+                    new_result[i] = maybe_autoconvert(adjusted_return_types[i], ret)
             
-            result = tuple(new_result)
+                result = tuple(new_result)
             
-            # If preview items were added, wrap the result.
-            if _curr_preview:
-                result = {"ui": _curr_preview.copy(), "result": result}
-            return result
+                # If preview items were added, wrap the result.
+                if _curr_preview:
+                    result = {"ui": _curr_preview.copy(), "result": result}
+                return result
 
-        except Exception as e:
-            logging.error(f"Error while processing: {func}: {e}")
-            if try_count == max_tries:
-                # Calculate the number of interesting stack levels.
-                _, _, tb = sys.exc_info()
-                the_stack = traceback.extract_tb(tb)
-                e.num_interesting_levels = len(the_stack) - 1
-                logging.info(the_stack)
+            except Exception as e:
+                logging.error(f"Error while processing: {func}: {e}")
+                if try_count == max_tries:
+                    # Calculate the number of interesting stack levels.
+                    _, _, tb = sys.exc_info()
+                    the_stack = traceback.extract_tb(tb)
+                    e.num_interesting_levels = len(the_stack) - 1
+                    logging.info(the_stack)
                 
-                formatted_stack = "\n".join(traceback.format_exception(type(e), e, tb))
+                    formatted_stack = "\n".join(traceback.format_exception(type(e), e, tb))
                 
-                logging.warning(f"{formatted_stack}")
+                    logging.warning(f"{formatted_stack}")
                 
-                raise e
+                    raise e
             
-            if llm_debugging_enabled:
                 llm_debugging.process_exception_logic(func, e, input_desc, buffer)
 
-        finally:
-            node_logger.removeHandler(buffer_handler)
-            sys.stdout = sys.__stdout__
-            if buffer:
-                buffer.close()
-
     assert False, "Should never reach this point"
     
 
@@ -758,6 +882,8 @@ def ComfyNode(
         wrapped_name = func.__qualname__ + "_comfynode_wrapper"
         source_location = f"{filename}:{func.__code__.co_firstlineno}"
         code_origin_loc = f"\n Source: {func.__qualname__} {source_location}"
+        # Generated functions (e.g. field setters) can point the UI's editor link at the user's code instead.
+        source_location = getattr(func, "_easy_nodes_source_location", source_location)
         original_is_changed = is_changed
         wrapped_is_changed = is_changed
         
@@ -776,7 +902,7 @@ def ComfyNode(
             
             try:
                 if original_is_changed:
-                    original_is_changed_params = inspect.signature(original_is_changed).parameters
+                    original_is_changed_params = _get_signature(original_is_changed).parameters
                     filtered_kwargs = {key: value for key, value in kwargs.items() if key in original_is_changed_params}
                     original_num = original_is_changed(*args, **filtered_kwargs)
                     original_num = hash(original_num)
@@ -836,8 +962,14 @@ def ComfyNode(
         name_parts = [x.title() for x in func.__name__.split("_")]
         input_is_list = any(input_is_list_map.values())
         
-        sig = inspect.signature(func)
-        param_names = list(sig.parameters.keys())
+        sig = _get_signature(func)
+        param_names = set(sig.parameters.keys())
+
+        # Everything below only depends on the annotations, so work it out once here rather than on every call.
+        all_inputs = {**required_inputs, **optional_inputs}
+        mask_inputs = {key for key, value in required_inputs.items() if value[0] == "MASK"}
+        autoconvert_inputs = {key: value[0] for key, value in all_inputs.items()
+                              if not isinstance(value[0], list) and _SHOULD_AUTOCONVERT.get(value[0], False)}
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -855,10 +987,8 @@ def ComfyNode(
                 for key, arg in kwargs.items():
                     logger.info(f"kwarg {key}: {type(arg)}")
 
-            all_inputs = {**required_inputs, **optional_inputs}
-
-            input_desc = []
             keys = list(kwargs.keys())
+            gpu_device = _get_gpu_device() if curr_config.auto_move_tensors else None
             
             for key in keys:
                 arg = kwargs[key]
@@ -873,10 +1003,10 @@ def ComfyNode(
                     kwargs.pop(key)
                     continue
                 
-                arg = _move_all_tensors_to_device(_gpu_device, arg) if curr_config.auto_move_tensors else arg
+                arg = _move_all_tensors_to_device(gpu_device, arg) if gpu_device is not None else arg
                 
                 # TODO: Remove this special handling for mask once I remember what needed it.
-                if (key in required_inputs and required_inputs[key][0] == "MASK"):
+                if key in mask_inputs:
                     if isinstance(arg, torch.Tensor):
                         if len(arg.shape) == 2:
                             arg = arg.unsqueeze(0)
@@ -886,17 +1016,16 @@ def ComfyNode(
                                 arg[i] = a.unsqueeze(0)
 
                 # TODO: Move this into _call_function_and_verify_result 
-                if key in all_inputs:
-                    arg = maybe_autoconvert(all_inputs[key][0], arg)
-                
-                desc_name = _get_fully_qualified_name(type(arg))
-                if isinstance(arg, torch.Tensor):
-                    input_desc.append(f"{key} ({desc_name}): {_image_info(arg)}")
-                else:
-                    input_desc.append(f"{key} ({desc_name}): {arg}")
+                if key in autoconvert_inputs:
+                    arg = maybe_autoconvert(autoconvert_inputs[key], arg)
                 
                 kwargs[key] = arg
             
+            # Only the LLM debugger uses the description, and only when there's a retry to feed it to.
+            # Built before the call (and the list unwrapping below) so it shows the values the node was given.
+            max_tries = _get_max_tries()
+            input_desc = _describe_inputs(kwargs) if max_tries > 1 else None
+            
             # TODO: Move this into _call_function_and_verify_result
             input_names = [key for key in list(kwargs.keys()) if key not in hidden_inputs]
             input_values = [kwargs[key] for key in input_names]
@@ -924,7 +1053,7 @@ def ComfyNode(
             
             latest_func = _get_latest_version_of_func(func, debug)
             
-            result = _call_function_and_verify_result(curr_config, latest_func, args, kwargs, debug, input_desc, adjusted_return_types, wrapped_name,
+            result = _call_function_and_verify_result(curr_config, latest_func, args, kwargs, debug, input_desc, max_tries, adjusted_return_types, wrapped_name,
                                                       return_names=return_names)
 
             return result
@@ -974,6 +1103,20 @@ def ComfyNode(
     return decorator
 
 
+@functools.lru_cache(maxsize=None)
+def _get_cached_signature(func: callable) -> inspect.Signature:
+    return inspect.signature(func)
+
+
+def _get_signature(func: callable) -> inspect.Signature:
+    """Cached inspect.signature; decoration and is_changed both need it repeatedly for the same callables."""
+    try:
+        return _get_cached_signature(func)
+    except TypeError:
+        # Unhashable callables (e.g. instances of a dataclass with eq=True) can't be cached.
+        return inspect.signature(func)
+
+
 def _annotate_input(
     annotation, default=inspect.Parameter.empty, debug=False
 ) -> tuple[tuple, bool, bool]:
@@ -1019,7 +1162,7 @@ def _infer_input_types_from_annotations(func, skip_first, debug=False):
     """
     input_is_list = {}
     input_type_map = {}
-    sig = inspect.signature(func)
+    sig = _get_signature(func)
     required_inputs = {}
     hidden_input_types = {"unique_id": "UNIQUE_ID", "extra_pnginfo": "EXTRA_PNGINFO"}
     optional_input_types = {}
@@ -1066,7 +1209,7 @@ def _infer_return_types_from_annotations(func_or_types, debug=False):
         origin = tuple  # Assume tuple if directly provided with a list
     else:
         # Assuming it's a function, inspect its return annotation
-        return_annotation = inspect.signature(func_or_types).return_annotation
+        return_annotation = _get_signature(func_or_types).return_annotation
         return_args = get_args(return_annotation)
         origin = get_origin(return_annotation)
 
@@ -1112,11 +1255,23 @@ def _infer_return_types_from_annotations(func_or_types, debug=False):
 def hex_to_color(color: str) -> list[float]:
     col = color.strip('#').strip().upper()
     assert len(col) == 6, f"Color must be a hex color code, got {color}"
-    assert all(c in "0123456789ABCDEF" for c in col), f"Color must be a hex color code, got {color}"
-    color_rgb = [int(col[i : i + 2], 16) for i in [0, 2, 4]]
+    # int() alone would also accept signs, underscores and non-ASCII digits.
+    assert col.isascii() and col.isalnum(), f"Color must be a hex color code, got {color}"
+    try:
+        value = int(col, 16)
+    except ValueError:
+        raise AssertionError(f"Color must be a hex color code, got {color}") from None
+    color_rgb = [(value >> 16) & 0xFF, (value >> 8) & 0xFF, value & 0xFF]
     return color_rgb
 
 
+@functools.lru_cache(maxsize=256)
+def _default_bg_color(color: str) -> str:
+    """The background color used when only a foreground color is given: the same color, darkened."""
+    r, g, b = hex_to_color(color)
+    return f"#{int(r * 0.6):02X}{int(g * 0.6):02X}{int(b * 0.6):02X}"
+
+
 def _create_comfy_node(
     cname,
     category,
@@ -1145,10 +1300,10 @@ def _create_comfy_node(
     
     node_info = {}
     if color is not None:
-        color_rgb = hex_to_color(color)
+        default_bg_color = _default_bg_color(color)  # Also validates color.
         node_info["color"] = color
         if not bg_color:
-            bg_color = "#" + "".join(f"{int(c * 0.6):02X}" for c in color_rgb)
+            bg_color = default_bg_color
             
     if bg_color is not None:
         _ = hex_to_color(bg_color)  # Check that it's a valid color
@@ -1162,39 +1317,42 @@ def _create_comfy_node(
     if node_info:
         description = f"EasyNodesInfo={json.dumps(node_info)}\n" + description
 
-    # Initial class dictionary setup
+    # Initial class dictionary setup. ComfyUI polls INPUT_TYPES() often, so it hands back the
+    # dict built above every time rather than rebuilding it; RETURN_TYPES is likewise a plain tuple.
     class_dict = {
         "INPUT_TYPES": classmethod(lambda cls: all_inputs),
         "CATEGORY": category,
         "RETURN_TYPES": return_types,
         "FUNCTION": cname,
-        "INPUT_IS_LIST": input_is_list,
-        "OUTPUT_IS_LIST": output_is_list,
-        "OUTPUT_NODE": is_output_node,
-        "RETURN_NAMES": return_names,
-        "VALIDATE_INPUTS": validate_inputs,
-        "IS_CHANGED": is_changed,
-        "DESCRIPTION": description,
         cname: process_function,
     }
-    class_dict = {k: v for k, v in class_dict.items() if v is not None}
+    # Leave the optional attributes off entirely rather than setting them to None.
+    for key, value in (("INPUT_IS_LIST", input_is_list),
+                       ("OUTPUT_IS_LIST", output_is_list),
+                       ("OUTPUT_NODE", is_output_node),
+                       ("RETURN_NAMES", return_names),
+                       ("VALIDATE_INPUTS", validate_inputs),
+                       ("IS_CHANGED", is_changed),
+                       ("DESCRIPTION", description)):
+        if value is not None:
+            class_dict[key] = value
 
     if debug:
         logger = logging.getLogger(cname)
-        for key, value in class_dict.items():
-            logger.info(f"{key}: {value}")
+        if logger.isEnabledFor(logging.INFO):
+            for key, value in class_dict.items():
+                logger.info("%s: %s", key, value)
             
     class_map = easy_nodes_config.NODE_CLASS_MAPPINGS
     display_map = easy_nodes_config.NODE_DISPLAY_NAME_MAPPINGS
 
     if not _after_first_prompt:
-        all_workflow_names = set(class_map.keys()) | set(comfyui_nodes.NODE_CLASS_MAPPINGS.keys())
-        all_display_names = set(display_map.values()) | set(comfyui_nodes.NODE_DISPLAY_NAME_MAPPINGS.values())
-        all_node_classes = set(class_map.values()) | set(comfyui_nodes.NODE_CLASS_MAPPINGS.values())
-
-        assert workflow_name not in all_workflow_names, f"Node class '{workflow_name} ({cname})' already exists!"
-        assert display_name not in all_display_names, f"Display name '{display_name}' already exists!"
-        assert node_class not in all_node_classes, f"Only one method from '{node_class}' can be used as a ComfyUI node."
+        # Scanning ComfyUI's maps by value would cost O(N) per node, since our own nodes end up in them too.
+        assert workflow_name not in class_map and workflow_name not in comfyui_nodes.NODE_CLASS_MAPPINGS, (
+            f"Node class '{workflow_name} ({cname})' already exists!")
+        assert display_name not in _registered_display_names, f"Display name '{display_name}' already exists!"
+        assert node_class is None or node_class not in _registered_node_classes, (
+            f"Only one method from '{node_class}' can be used as a ComfyUI node.")
 
     if node_class:
         for key, value in class_dict.items():
@@ -1204,6 +1362,8 @@ def _create_comfy_node(
 
     class_map[workflow_name] = node_class
     display_map[workflow_name] = display_name
+    _registered_display_names.add(display_name)
+    _registered_node_classes.add(node_class)
     
     # Temporary for backwards compatibility.
     if easy_nodes_config.auto_register is AutoRegisterSentinel.DEFAULT:
@@ -1213,33 +1373,42 @@ def _create_comfy_node(
     easy_nodes_config.num_registered += 1
 
 
-def _is_static_method(cls, attr):
-    """Check if a method is a static method."""
+@functools.lru_cache(maxsize=1024)
+def _get_method_kind(cls, attr) -> str:
+    """Returns 'static', 'class' or 'instance' based on how attr is defined on cls, or None if cls is None."""
     if cls is None:
-        return False
+        return None
+    # getattr_static walks the MRO, so do it once for both of the checks below.
     attr_value = inspect.getattr_static(cls, attr, None)
-    is_static = isinstance(attr_value, staticmethod)
-    return is_static
+    if isinstance(attr_value, staticmethod):
+        return "static"
+    if isinstance(attr_value, classmethod):
+        return "class"
+    return "instance"
+
+
+def _is_static_method(cls, attr):
+    """Check if a method is a static method."""
+    return _get_method_kind(cls, attr) == "static"
 
 
 def _is_class_method(cls, attr):
-    if cls is None:
-        return False
-    attr_value = inspect.getattr_static(cls, attr, None)
-    is_class_method = isinstance(attr_value, classmethod)
-    return is_class_method
+    return _get_method_kind(cls, attr) == "class"
 
 
 def _get_node_class(func):
-    split_name = func.__qualname__.split(".")
-
-    if len(split_name) > 1:
-        class_name = split_name[-2]
+    qualname = func.__qualname__
+    if "." not in qualname:
+        return None
+
+    class_name = qualname.rsplit(".", 2)[-2]
+    # The function's own module is where its class would be defined, so look there first.
+    node_class = None
+    if hasattr(func, "__globals__"):
+        node_class = func.__globals__.get(class_name, None)
+    if node_class is None:
         node_class = globals().get(class_name, None)
-        if node_class is None and hasattr(func, "__globals__"):
-            node_class = func.__globals__.get(class_name, None)
-        return node_class
-    return None
+    return node_class
 
 
 T = typing.TypeVar("T")
@@ -1257,125 +1426,117 @@ def create_field_setter_node(cls: type, category=None, debug=False) -> typing.Ca
         dynamic_function)
 
 
+# Builders for each setter parameter's default, keyed by the property's type.
+_SETTER_DEFAULT_BUILDERS = {
+    int: lambda value: NumberInput(value),
+    float: lambda value: NumberInput(value, -1000000, 10000000, 0.0001),
+    str: lambda value: StringInput(value),
+    bool: lambda value: value,
+}
+
+
 def _create_dynamic_setter(cls: type, debug=False) -> typing.Callable[..., T]:
     obj = cls()
     func_name = cls.__name__
     setter_name = func_name + "_setter"
     
     properties = {}
-    all_type_names = set([])
+
+    # Read the names straight out of the class and instance dicts rather than dir(), so dunders
+    # get dropped before anything is looked up on the object, and properties can be recognized.
+    class_attrs = {}
+    for klass in type(obj).__mro__:
+        for attr_name, attr in vars(klass).items():
+            class_attrs.setdefault(attr_name, attr)
+    attr_names = set(class_attrs)
+    attr_names.update(getattr(obj, "__dict__", ()))
 
     # Collect properties and infer types from their current instantiated values.
-    for attr_name in dir(obj):
+    # Sorted like dir() was, since this decides the order of the node's widgets.
+    for attr_name in sorted(attr_names):
+        if attr_name.startswith("__"):
+            continue
+        class_attr = class_attrs.get(attr_name)
+        if isinstance(class_attr, property) and class_attr.fset is None:
+            # Read-only, so the setter couldn't assign it anyway.
+            continue
         attr = getattr(obj, attr_name, None)
-        if attr is not None and not callable(attr) and not attr_name.startswith("__"):
-            if isinstance(attr, property) and attr.fset is not None:
+        if attr is not None and not callable(attr):
+            if isinstance(class_attr, property):
                 # Handle properties
-                current_value = getattr(obj, attr_name, None)
+                current_value = attr
                 prop_type = type(current_value) if current_value is not None else typing.Any
                 properties[attr_name] = (prop_type, current_value)
 
                 if debug:
-                    logging.info(
-                        f"Property '{attr_name}' has type '{prop_type}' and value '{current_value}'"
-                    )
+                    logging.info("Property '%s' has type '%s' and value '%s'",
+                                 attr_name, prop_type, current_value)
             else:
                 # Handle instance attributes
-                current_value = getattr(obj, attr_name, None)
+                current_value = attr
                 prop_type = type(current_value) if current_value is not None else typing.Any
                 properties[attr_name] = (prop_type, current_value)
 
                 if debug:
-                    logging.info(
-                        f"Instance attribute '{attr_name}' has type '{prop_type}' and value '{current_value}'"
-                    )
-
-            # Automatically register the type and its subtypes, allowing duplicates
-            register_type(
-                prop_type, _get_fully_qualified_name(prop_type), is_auto_register=True
-            )
+                    logging.info("Instance attribute '%s' has type '%s' and value '%s'",
+                                 attr_name, prop_type, current_value)
+
+            # Automatically register the type and its subtypes, allowing duplicates. Types that
+            # are already known (the usual case, e.g. int or str) would be a no-op, so skip the call.
+            qualified_type_name = _get_fully_qualified_name(prop_type)
+            if qualified_type_name not in _ANNOTATION_TO_COMFYUI_TYPE:
+                register_type(prop_type, qualified_type_name, is_auto_register=True)
             if hasattr(prop_type, "__args__"):
                 for subtype in prop_type.__args__:
-                    register_type(
-                        subtype,
-                        _get_fully_qualified_name(subtype),
-                        is_auto_register=True,
-                    )
-
-            # Extract module name from the property type
-            fully_qualled_name = _get_fully_qualified_name(prop_type)
-            if "." in fully_qualled_name:
-                all_type_names.add(fully_qualled_name)
-
-    def get_default_value(prop_type, current_value):
-        default_values = {
-            int: f"NumberInput({current_value})",
-            float: f"NumberInput({current_value}, -1000000, 10000000, 0.0001)",
-            str: f"StringInput('{current_value}')",
-            bool: f"{current_value}",
-        }
-        return default_values.get(prop_type, "None")
+                    qualified_subtype_name = _get_fully_qualified_name(subtype)
+                    if qualified_subtype_name not in _ANNOTATION_TO_COMFYUI_TYPE:
+                        register_type(subtype, qualified_subtype_name, is_auto_register=True)
+
+    # Fetch the class from its module on each call so reloaded versions get picked up. Classes that
+    # aren't module-level attributes (e.g. nested ones) can't be found that way, so those are used as is.
+    module = _get_module(cls.__module__)
+    if getattr(module, func_name, None) is not cls:
+        module = None
 
-    func_params = []
+    parameters = []
     for prop, (prop_type, current_value) in properties.items():
-        qualified_type_name = _get_fully_qualified_name(prop_type).replace('builtins.', '')
-        default_value = get_default_value(prop_type, current_value)
-        func_params.append(f"{prop}: {qualified_type_name}={default_value}")
-
-    def_str = f"def {setter_name}("
-    join_str = ",\n" + " " * len(def_str)
-    func_params_str = join_str.join(func_params)
-
-    # Generate import statements
-    import_statements = [
-        "import typing",
-        "import importlib",
-        "from easy_nodes import NumberInput, StringInput",
-        # "import example.example_nodes",
-    ]
-    
-    for module_name in all_type_names:
-        if module_name.startswith("builtins."):
-            continue
-        package_name, type_name = module_name.rsplit(".", 1)
-        import_statements.append(f"import {package_name}")
-        
-    # Alphabetize them and make unique
-    import_statements = sorted(list(dict.fromkeys(import_statements)))
-
-    func_body_lines = [
-        f"cls = getattr(module, '{func_name}')",
-        "new_obj = cls()",
-    ]
-    for prop in properties.keys():
-        func_body_lines.append(f"if {prop} is not None: setattr(new_obj, '{prop}', {prop})")
-    func_body_lines.append("return new_obj")
-    func_body_lines = [f"    {line}" for line in func_body_lines]
-    
-    func_lines = import_statements + [f"module = importlib.import_module('{cls.__module__}')",
-                                     f"{def_str}{func_params_str}) -> module.{cls.__name__}:"] + func_body_lines 
-    func_code = "\n".join(func_lines)
+        default_builder = _SETTER_DEFAULT_BUILDERS.get(prop_type)
+        default = default_builder(current_value) if default_builder else None
+        parameters.append(inspect.Parameter(prop, inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                                            default=default, annotation=prop_type))
+    signature = inspect.Signature(parameters, return_annotation=cls)
+
+    def setter(*args, **kwargs):
+        # Binding raises a TypeError for unknown fields, like a function with real parameters would.
+        bound_args = signature.bind(*args, **kwargs)
+        bound_args.apply_defaults()
+        new_obj = getattr(module, func_name)() if module is not None else cls()
+        for prop, value in bound_args.arguments.items():
+            if value is not None:
+                setattr(new_obj, prop, value)
+        return new_obj
+
+    # ComfyNode reads the inputs and output off the signature and annotations, so describe
+    # the fields there rather than generating a function with real parameters.
+    setter.__signature__ = signature
+    setter.__annotations__ = {prop: prop_type for prop, (prop_type, _) in properties.items()}
+    setter.__annotations__["return"] = cls
+    setter.__name__ = setter.__qualname__ = setter_name
+    # Doesn't belong to any module's namespace, so there's nothing for reload-on-edit to refresh.
+    setter.__module__ = None
+    # Link the node to the user's class rather than this closure, or to nothing if its file can't be found.
+    # getsourcelines() would re-parse the whole module to find the line, so only use one if Python
+    # recorded it (3.13+) and otherwise just point at the file.
+    try:
+        source_location = inspect.getsourcefile(cls)
+    except (OSError, TypeError):
+        source_location = None
+    first_line = getattr(cls, "__firstlineno__", None)
+    if source_location and first_line is not None:
+        source_location = f"{source_location}:{first_line}"
+    setter._easy_nodes_source_location = source_location
 
     if debug:
-        logging.info(f"Creating dynamic setter with code: '{func_code}'")
-
-    globals_dict = {
-        "typing": typing,
-        "importlib": importlib,
-        "NumberInput": NumberInput,
-        "StringInput": StringInput,
-        "module": importlib.import_module(cls.__module__),
-    }
-    locals_dict = {}
-
-    # Update the global namespace with the module names
-    # for module_name in module_names:
-    #     globals_dict[module_name] = importlib.import_module(module_name)
-    
-    # Execute the function code
-    exec(func_code, globals_dict, locals_dict)
-
-    # Get the function object from the local namespace
-    func = locals_dict[setter_name]
+        logging.info("Created dynamic setter %s%s", setter_name, setter.__signature__)
 
-    return func
+    return setter
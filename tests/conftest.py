@@ -0,0 +1,46 @@
+import sys
+import types
+
+
+class _Routes:
+    def get(self, path):
+        return lambda handler: handler
+
+    post = get
+
+
+def _install_comfyui_stand_ins():
+    """EasyNodes imports a few of ComfyUI's own modules. Outside a ComfyUI checkout, stand in for them."""
+    try:
+        import nodes  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    nodes = types.ModuleType("nodes")
+    nodes.EXTENSION_WEB_DIRS = {}
+    nodes.NODE_CLASS_MAPPINGS = {}
+    nodes.NODE_DISPLAY_NAME_MAPPINGS = {}
+
+    server = types.ModuleType("server")
+    server.PromptServer = type("PromptServer", (), {})
+    server.PromptServer.instance = types.SimpleNamespace(routes=_Routes())
+
+    comfy = types.ModuleType("comfy")
+    clip_vision = types.ModuleType("comfy.clip_vision")
+    clip_vision.ClipVisionModel = type("ClipVisionModel", (), {})
+    sd = types.ModuleType("comfy.sd")
+    sd.VAE = type("VAE", (), {})
+    comfy.clip_vision = clip_vision
+    comfy.sd = sd
+
+    sys.modules.update({
+        "nodes": nodes,
+        "server": server,
+        "comfy": comfy,
+        "comfy.clip_vision": clip_vision,
+        "comfy.sd": sd,
+    })
+
+
+_install_comfyui_stand_ins()
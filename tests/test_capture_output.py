@@ -0,0 +1,78 @@
+import logging
+import sys
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("aiohttp")
+
+import easy_nodes.config_service as config_service  # noqa: E402
+import easy_nodes.easy_nodes as easy_nodes  # noqa: E402
+import easy_nodes.llm_debugging as llm_debugging  # noqa: E402
+from easy_nodes.easy_nodes import _capture_output  # noqa: E402
+
+
+def test_capture_output_captures_and_restores_stdout_and_logging():
+    root_logger = logging.getLogger()
+    original_stdout = sys.stdout
+    original_handlers = list(root_logger.handlers)
+
+    with _capture_output(True) as buffer:
+        print("printed by the node")
+        logging.info("logged by the node")
+        captured = buffer.getvalue()
+
+    assert "printed by the node" in captured
+    assert "INFO: logged by the node" in captured
+    assert sys.stdout is original_stdout
+    assert root_logger.handlers == original_handlers
+    assert buffer.closed
+
+
+def test_capture_output_restores_after_exception():
+    root_logger = logging.getLogger()
+    original_stdout = sys.stdout
+    original_handlers = list(root_logger.handlers)
+
+    with pytest.raises(ValueError):
+        with _capture_output(True):
+            raise ValueError("node failed")
+
+    assert sys.stdout is original_stdout
+    assert root_logger.handlers == original_handlers
+
+
+def test_capture_output_disabled_yields_none():
+    with _capture_output(False) as buffer:
+        assert buffer is None
+    assert logging.getLogger().level == logging.INFO
+
+
+@pytest.mark.parametrize("mode", ["Off", "On", "AutoFix"])
+def test_failing_node_runs_once_and_raises_its_own_error(monkeypatch, mode):
+    monkeypatch.setattr(config_service, "USER_CONFIG", {"easy_nodes": {"llm_debugging": mode, "max_tries": 3}})
+
+    def fail_if_called(*args, **kwargs):
+        raise AssertionError("The LLM debugger should not run.")
+
+    monkeypatch.setattr(llm_debugging, "process_exception_logic", fail_if_called)
+
+    calls = []
+
+    def failing_node():
+        calls.append(sys.stdout)
+        raise ValueError("node failed")
+
+    config = easy_nodes.EasyNodesConfig("test", False, easy_nodes.AutoDescriptionMode.NONE,
+                                        easy_nodes.CheckSeverityMode.OFF, False, {}, {})
+    max_tries = easy_nodes._get_max_tries()
+    assert max_tries == 1
+
+    with pytest.raises(ValueError, match="node failed") as exc_info:
+        easy_nodes._call_function_and_verify_result(config, failing_node, (), {}, False, None, max_tries,
+                                                    [], "failing_node")
+
+    assert len(calls) == 1
+    # A single try doesn't capture, so the node wrote straight to the real stdout.
+    assert calls[0] is sys.stdout
+    assert hasattr(exc_info.value, "num_interesting_levels")
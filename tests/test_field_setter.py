@@ -0,0 +1,135 @@
+import inspect
+import json
+import sys
+import types
+
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("aiohttp")
+
+import easy_nodes  # noqa: E402
+import easy_nodes.easy_nodes as en  # noqa: E402
+
+
+class SetterFields:
+    def __init__(self):
+        self.count = 3
+        self.scale = 0.5
+        self.label = "hello"
+        self.enabled = True
+        self._size = 7
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, value):
+        self._size = value
+
+    @property
+    def area(self):
+        return self._size * self._size
+
+
+class Outer:
+    class Inner:
+        def __init__(self):
+            self.value = 1
+
+
+@pytest.fixture(scope="module")
+def node_mappings():
+    easy_nodes.initialize_easy_nodes(default_category="Test", auto_register=False)
+    easy_nodes.register_type(SetterFields, "SETTER_FIELDS")
+    easy_nodes.register_type(Outer.Inner, "INNER")
+    easy_nodes.create_field_setter_node(SetterFields)
+    easy_nodes.create_field_setter_node(Outer.Inner)
+    return en._get_curr_config().NODE_CLASS_MAPPINGS
+
+
+def _run_node(node_class, **kwargs):
+    return getattr(node_class(), node_class.FUNCTION)(**kwargs)
+
+
+def test_field_setter_input_types(node_mappings):
+    node_class = node_mappings["SetterFields"]
+    input_types = node_class.INPUT_TYPES()
+    required = input_types["required"]
+
+    # Read-only properties can't be set, so they aren't inputs.
+    assert list(required) == ["_size", "count", "enabled", "label", "scale", "size"]
+    assert required["count"][0] == "INT"
+    assert required["count"][1]["default"] == 3
+    assert required["scale"][0] == "FLOAT"
+    assert required["scale"][1]["default"] == 0.5
+    assert required["scale"][1]["min"] == -1000000
+    assert required["scale"][1]["max"] == 10000000
+    assert required["scale"][1]["step"] == 0.0001
+    assert required["label"][0] == "STRING"
+    assert required["label"][1]["default"] == "hello"
+    assert required["enabled"][0] == "BOOLEAN"
+    # bool is an int, so its default goes through NumberInput like one.
+    assert required["enabled"][1]["default"] == 1
+    assert required["size"][0] == "INT"
+    assert required["size"][1]["default"] == 7
+    assert input_types["optional"] == {}
+    assert input_types["hidden"] == {"unique_id": "UNIQUE_ID", "extra_pnginfo": "EXTRA_PNGINFO"}
+    assert node_class.RETURN_TYPES == ("SETTER_FIELDS",)
+
+
+def test_field_setter_round_trip(node_mappings):
+    result = _run_node(node_mappings["SetterFields"], _size=7, count=5, enabled=False, label="world", scale=2.5, size=9)
+
+    assert len(result) == 1
+    obj = result[0]
+    assert isinstance(obj, SetterFields)
+    assert (obj.count, obj.scale, obj.label, obj.enabled, obj.size) == (5, 2.5, "world", False, 9)
+
+
+def test_field_setter_source_location(node_mappings):
+    description = node_mappings["SetterFields"].DESCRIPTION
+    node_info = json.loads(description.split("\n", 1)[0][len("EasyNodesInfo="):])
+
+    expected = inspect.getsourcefile(SetterFields)
+    if sys.version_info >= (3, 13):
+        expected += f":{SetterFields.__firstlineno__}"
+    assert node_info["sourceLocation"] == expected
+
+
+def test_field_setter_for_nested_class(node_mappings):
+    node_class = node_mappings["Inner"]
+    assert list(node_class.INPUT_TYPES()["required"]) == ["value"]
+
+    obj = _run_node(node_class, value=4)[0]
+    assert isinstance(obj, Outer.Inner)
+    assert obj.value == 4
+
+
+def test_field_setter_for_class_without_source_file(node_mappings, monkeypatch):
+    # Classes defined in a REPL, notebook or `python -c` live in a __main__ with no file.
+    monkeypatch.setitem(sys.modules, "__main__", types.ModuleType("__main__"))
+
+    def __init__(self):
+        self.x = 1
+
+    no_source_file = type("NoSourceFile", (), {"__init__": __init__, "__module__": "__main__"})
+    easy_nodes.register_type(no_source_file, "NO_SOURCE_FILE")
+    easy_nodes.create_field_setter_node(no_source_file)
+
+    node_class = node_mappings["NoSourceFile"]
+    assert "sourceLocation" not in node_class.DESCRIPTION
+    obj = _run_node(node_class, x=2)[0]
+    assert isinstance(obj, no_source_file)
+    assert obj.x == 2
+
+
+def test_field_setter_binds_like_a_function():
+    setter = en._create_dynamic_setter(SetterFields)
+
+    assert list(inspect.signature(setter).parameters) == ["_size", "count", "enabled", "label", "scale", "size"]
+    obj = setter(1, 2, False, "positional", 0.25, 1)
+    assert (obj.count, obj.label, obj.size) == (2, "positional", 1)
+    with pytest.raises(TypeError):
+        setter(count=1, bogus=2)
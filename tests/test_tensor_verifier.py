@@ -0,0 +1,27 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("aiohttp")
+
+from easy_nodes.easy_nodes import TensorVerifier  # noqa: E402
+
+
+def _mask_verifier():
+    return TensorVerifier("MASK", allowed_shapes=[3], allowed_range=[0, 1])
+
+
+def test_mask_in_range_passes():
+    _mask_verifier()(torch.rand(1, 4, 4))
+
+
+@pytest.mark.parametrize("value", [-0.5, 1.5])
+def test_mask_out_of_range_fails(value):
+    with pytest.raises(AssertionError, match="must have values between 0 and 1"):
+        _mask_verifier()(torch.full((1, 4, 4), value))
+
+
+@pytest.mark.parametrize("dtype", [torch.float32, torch.bool])
+def test_empty_mask_fails(dtype):
+    # There's no min or max to check against the range, so an empty mask doesn't verify.
+    with pytest.raises(RuntimeError):
+        _mask_verifier()(torch.empty(1, 0, 4, dtype=dtype))